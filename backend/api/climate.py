@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
@@ -154,4 +154,14 @@ async def get_farm_weather(
         raise HTTPException(
             status_code=500, 
             detail=f"Failed to fetch weather data: {str(e)}"
-        )
\ No newline at end of file
+        )
+
+@router.get("/locations/{location_name}")
+async def get_location(location_name: str):
+    """Get reference data for a Ugandan location"""
+    payload = uganda_service.get_location_json(location_name)
+    if payload is None:
+        raise HTTPException(status_code=404, detail="Location not found")
+    
+    # Pre-serialized at startup; send the bytes as-is
+    return Response(content=payload, media_type="application/json")
\ No newline at end of file
@@ -6,6 +6,7 @@ from passlib.context import CryptContext
 from jose import JWTError, jwt
 from datetime import datetime, timedelta
 from typing import Optional
+import asyncio
 import os
 from dotenv import load_dotenv
 
@@ -18,7 +19,7 @@ from models.pydantic_models import (
 )
 from services.recommendation_engine import SeedRecommendationEngine
 from services.climate_service import WeatherDataService
-from services.soil_service import SoilAnalysisService
+from services.soil_service import SoilAnalysisService, aclose_async_client
 from api.auth import get_current_user, create_access_token, authenticate_user
 from api.farms import router as farms_router
 from api.seeds import router as seeds_router
@@ -58,12 +59,18 @@ async def startup_event():
     create_tables()
     init_sample_data()
     
-    # Try to load pre-trained models
+    # Try to load pre-trained models; off the event loop, since a first load
+    # may compile tree models with gcc
     try:
-        recommendation_engine.load_models()
+        await asyncio.to_thread(recommendation_engine.load_models)
     except Exception as e:
         print(f"No pre-trained models found: {e}")
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release pooled HTTP connections on shutdown"""
+    await aclose_async_client()
+
 # Include API routers
 app.include_router(farms_router, prefix="/api/farms", tags=["Farms"])
 app.include_router(seeds_router, prefix="/api/seeds", tags=["Seeds"])
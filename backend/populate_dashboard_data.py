@@ -48,8 +48,8 @@ def create_seed_recommendations():
                 suitability_score = 0.9 - (i * 0.1)  # Descending suitability
                 confidence_level = 0.8 + (random.random() * 0.2)  # 0.8 to 1.0
                 reasoning = {
-                    "climate_match": f"Suitable for {location.climate_zone.value} climate zone",
-                    "regional_fit": f"Recommended for {location.region.value} region",
+                    "climate_match": f"Suitable for {location.climate_zone.label} climate zone",
+                    "regional_fit": f"Recommended for {location.region.label} region",
                     "crop_history": f"Good performance with {seed.crop_type} in this area"
                 }
                 
@@ -419,7 +419,7 @@ def create_sample_ugandan_farms():
         for farm in farms:
             location = uganda_service.find_nearest_location(farm.latitude, farm.longitude)
             if location:
-                region = location.region.value
+                region = location.region.label
                 region_counts[region] = region_counts.get(region, 0) + 1
         
         print("\\nFarms by region:")
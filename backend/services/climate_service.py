@@ -15,7 +15,8 @@ import logging
 from dataclasses import dataclass
 import os
 from dotenv import load_dotenv
-from .uganda_service import uganda_service, UgandanLocation
+from .location_cache import LocationFetchCache
+from .uganda_service import uganda_service, UgandanLocation, UgandaRegion
 
 load_dotenv()
 
@@ -33,6 +34,8 @@ class WeatherData:
     solar_radiation: Optional[float] = None
     pressure: Optional[float] = None
     date: datetime = None
+    # Generated from climate patterns rather than observed (e.g. after an API failure)
+    is_synthetic: bool = False
 
 @dataclass
 class ClimateProjection:
@@ -230,7 +233,8 @@ class WeatherDataService:
             rainfall=max(0, rainfall),
             humidity=np.random.normal(70, 10),
             wind_speed=np.random.normal(10, 3),
-            date=datetime.now()
+            date=datetime.now(),
+            is_synthetic=True
         )
     
     def _generate_synthetic_historical_weather(self, latitude: float, longitude: float, 
@@ -267,7 +271,8 @@ class WeatherDataService:
                 rainfall=rainfall,
                 humidity=np.random.normal(70, 10),
                 wind_speed=np.random.normal(10, 3),
-                date=current_date
+                date=current_date,
+                is_synthetic=True
             ))
             
             current_date += timedelta(days=1)
@@ -289,7 +294,7 @@ class WeatherDataService:
         from .uganda_service import UgandaRegion
         
         try:
-            region_enum = UgandaRegion(region)
+            region_enum = UgandaRegion.from_label(region)
             locations = uganda_service.get_locations_by_region(region_enum)
         except ValueError:
             logger.error(f"Invalid Ugandan region: {region}")
@@ -390,7 +395,7 @@ class WeatherDataService:
         humidity = (75 if is_wet_season else 60) + random.uniform(-10, 15)
         
         # Wind speed varies by region (Northern regions typically windier)
-        base_wind = 8 if location.region.value == "Northern" else 5
+        base_wind = 8 if location.region == UgandaRegion.NORTHERN else 5
         wind_speed = base_wind + random.uniform(-2, 4)
         
         return WeatherData(
@@ -400,7 +405,8 @@ class WeatherDataService:
             rainfall=max(0, rainfall),
             humidity=max(30, min(95, humidity)),
             wind_speed=max(0, wind_speed),
-            date=date
+            date=date,
+            is_synthetic=True
         )
     
     def _generate_synthetic_seasonal_forecast(self, location: UgandanLocation, months_ahead: int) -> List[WeatherData]:
@@ -592,13 +598,30 @@ climate_projection_service = ClimateProjectionService()
 # Create a unified climate service for backward compatibility
 class ClimateService:
     """Unified climate service combining weather and projection services"""
+    # Seconds a location's weather is served from the wrapper's cache
+    LOCATION_WEATHER_TTL = 600
+    
     def __init__(self):
         self.weather_service = weather_service
         self.projection_service = climate_projection_service
+        
+        # Weather per location name; concurrent misses share one fetch, and
+        # synthetic fallbacks from failed API calls are never cached
+        self._location_weather = LocationFetchCache(
+            ttl=self.LOCATION_WEATHER_TTL,
+            is_cacheable=lambda weather: not weather.is_synthetic
+        )
     
     async def get_weather_for_ugandan_location(self, location_name: str):
         """Get weather for a Ugandan location (async wrapper)"""
-        return self.weather_service.get_weather_for_ugandan_location(location_name)
+        async def fetch():
+            return self.weather_service.get_weather_for_ugandan_location(location_name)
+        
+        return await self._location_weather.get(location_name, fetch)
+    
+    def invalidate(self, location_name: str):
+        """Drop the cached weather for a location"""
+        self._location_weather.invalidate(location_name)
     
     async def get_regional_weather_uganda(self, region: str):
         """Get regional weather for Uganda (async wrapper)"""
@@ -0,0 +1,50 @@
+"""
+Per-location request coalescing and caching for the async service wrappers
+"""
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+import asyncio
+import time
+
+class LocationFetchCache:
+    """Shares one in-flight fetch per location name and optionally caches results.
+    
+    Names are matched case-insensitively. With `ttl=None` nothing is stored and
+    only concurrent requests are coalesced. None results (unknown locations) and
+    results rejected by `is_cacheable` are never stored.
+    """
+    
+    def __init__(self, ttl: Optional[float] = None, is_cacheable: Callable[[object], bool] = None):
+        self.ttl = ttl
+        self._is_cacheable = is_cacheable or (lambda value: True)
+        # Location name (case-folded) -> (value, monotonic timestamp)
+        self._entries: Dict[str, Tuple[object, float]] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+    
+    async def get(self, location_name: str, fetch: Callable[[], Awaitable[object]]):
+        """Return the cached value for a location, or await `fetch()` shared by concurrent callers"""
+        key = location_name.casefold()
+        if self.ttl is not None:
+            cached = self._entries.get(key)
+            if cached is not None and time.monotonic() - cached[1] < self.ttl:
+                return cached[0]
+        
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(key, fetch))
+            self._inflight[key] = task
+        # Shielded so one caller's cancellation doesn't cancel the fetch for the others
+        return await asyncio.shield(task)
+    
+    async def _fetch(self, key: str, fetch: Callable[[], Awaitable[object]]):
+        """Run a fetch, store its result if cacheable, and retire the in-flight entry"""
+        try:
+            value = await fetch()
+            if self.ttl is not None and value is not None and self._is_cacheable(value):
+                self._entries[key] = (value, time.monotonic())
+            return value
+        finally:
+            self._inflight.pop(key, None)
+    
+    def invalidate(self, location_name: str):
+        """Drop the cached value for a location"""
+        self._entries.pop(location_name.casefold(), None)
@@ -1,9 +1,17 @@
 import random
+from operator import attrgetter
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 import logging
 from datetime import datetime
+import hashlib
+import importlib
+import io
+import json
+import mmap
 import os
+import pickle
+import sys
 
 # Mock ML imports for now - replace with actual imports when ML packages are available
 try:
@@ -30,12 +38,224 @@ except ImportError:
     ML_AVAILABLE = False
     print("Warning: ML packages not available, using fallback recommendations")
 
+# joblib compresses pickles with lz4 when the codec is installed, else zlib
+try:
+    import lz4  # noqa: F401
+    _JOBLIB_COMPRESSION = ("lz4", 3)
+except ImportError:
+    _JOBLIB_COMPRESSION = 3
+
+# Optional safetensors support for memory-mappable model parameters
+try:
+    from safetensors import safe_open
+    from safetensors.numpy import save_file as save_safetensors
+    SAFETENSORS_AVAILABLE = True
+except ImportError:
+    safe_open = None
+    save_safetensors = None
+    SAFETENSORS_AVAILABLE = False
+
+# Optional Numba support for fused scaling + linear prediction
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    njit = None
+    prange = None
+    NUMBA_AVAILABLE = False
+
+# Optional treelite support for compiling tree ensembles to native predictors
+try:
+    import treelite
+    import treelite.sklearn
+    import treelite_runtime
+    TREELITE_AVAILABLE = True
+except ImportError:
+    treelite = None
+    treelite_runtime = None
+    TREELITE_AVAILABLE = False
+
+# Compiled treelite libraries live in a user cache directory, outside the
+# source tree, keyed by the hash of the model file they were built from
+MODEL_LIB_DIR = os.getenv(
+    "MODEL_LIB_DIR",
+    os.path.join(os.getenv("XDG_CACHE_HOME", os.path.expanduser("~/.cache")), "climate-seed-ai-bank", "treelite")
+)
+
 from .climate_service import WeatherDataService, ClimateProjectionService
 from .soil_service import SoilAnalysisService
 from models.database_models import Seed, Farm, CropCycle, SoilProfile, ClimateRecord
 
 logger = logging.getLogger(__name__)
 
+# Direct I/O fast path for model loading. Reading the bundle with O_DIRECT into
+# a page-aligned buffer bypasses the page cache, which pays off most in
+# multi-tenant cloud deployments where the cache is contended and large models
+# are rarely resident when a worker (re)starts.
+_DIRECT_IO_AVAILABLE = (
+    sys.platform.startswith("linux")
+    and hasattr(os, "O_DIRECT")
+    and hasattr(os, "preadv")
+)
+_DIRECT_IO_ALIGNMENT = mmap.PAGESIZE
+_DIRECT_IO_MIN_CHUNK = 64 * 1024          # 64 KB
+_DIRECT_IO_MAX_CHUNK = 16 * 1024 * 1024   # 16 MB
+
+def _read_file_direct(path: str) -> memoryview:
+    """Read a file with O_DIRECT and batched preadv calls into an aligned buffer"""
+    size = os.path.getsize(path)
+    padded_size = max(_DIRECT_IO_ALIGNMENT, -(-size // _DIRECT_IO_ALIGNMENT) * _DIRECT_IO_ALIGNMENT)
+    
+    # Anonymous mmaps are page-aligned, as O_DIRECT requires
+    buffer = memoryview(mmap.mmap(-1, padded_size))
+    fd = os.open(path, os.O_RDONLY | os.O_DIRECT)
+    try:
+        offset = 0
+        chunk = _DIRECT_IO_MIN_CHUNK
+        while offset < size:
+            read = os.preadv(fd, [buffer[offset:offset + chunk]], offset)
+            if read <= 0:
+                break
+            offset += read
+            # Adaptive chunking: grow towards 16 MB once the file proves large
+            chunk = min(chunk * 2, _DIRECT_IO_MAX_CHUNK)
+    finally:
+        os.close(fd)
+    
+    return buffer[:offset]
+
+def _load_joblib(path: str):
+    """Load a joblib file, using the direct I/O fast path where supported"""
+    if _DIRECT_IO_AVAILABLE:
+        try:
+            return joblib.load(io.BytesIO(_read_file_direct(path)))
+        except OSError as e:
+            # e.g. tmpfs and some network filesystems reject O_DIRECT
+            logger.debug(f"Direct I/O read failed for {path}, using buffered load: {e}")
+    return joblib.load(path)
+
+def _split_flat_estimator(estimator) -> Optional[Tuple[Dict, Dict]]:
+    """Split a fitted estimator into numpy tensors and JSON metadata.
+    
+    Returns None when the estimator has no flat tensor layout (e.g. tree
+    ensembles, whose fitted state is a list of Cython tree objects).
+    """
+    params = estimator.get_params(deep=False)
+    tensors = {}
+    fitted = {}
+    
+    for key, value in vars(estimator).items():
+        if key in params:
+            continue
+        if not key.endswith("_"):
+            return None
+        if isinstance(value, np.ndarray) and value.dtype != object:
+            tensors[key] = np.ascontiguousarray(value)
+        elif isinstance(value, np.generic):
+            fitted[key] = value.item()
+        elif isinstance(value, (bool, int, float, str)):
+            fitted[key] = value
+        else:
+            return None
+    
+    metadata = {
+        "module": type(estimator).__module__,
+        "class": type(estimator).__name__,
+        "params": params,
+        "fitted": fitted
+    }
+    return tensors, metadata
+
+def _remove_model_files(model_path: str, *names: str):
+    """Delete files from the model directory, ignoring ones that do not exist"""
+    for name in names:
+        try:
+            os.remove(os.path.join(model_path, name))
+        except FileNotFoundError:
+            pass
+
+def _save_estimator(estimator, model_path: str, stem: str):
+    """Save an estimator as safetensors + JSON sidecar, falling back to joblib.
+    
+    Files in the other format are removed, so a stale copy can never shadow
+    the fresh one in _load_estimator.
+    """
+    split = _split_flat_estimator(estimator) if SAFETENSORS_AVAILABLE else None
+    if split is None:
+        joblib.dump(
+            estimator,
+            os.path.join(model_path, f"{stem}.pkl"),
+            compress=_JOBLIB_COMPRESSION,
+            protocol=5
+        )
+        _remove_model_files(model_path, f"{stem}.safetensors", f"{stem}.json")
+        return
+    
+    tensors, metadata = split
+    save_safetensors(tensors, os.path.join(model_path, f"{stem}.safetensors"))
+    with open(os.path.join(model_path, f"{stem}.json"), "w") as f:
+        json.dump(metadata, f)
+    _remove_model_files(model_path, f"{stem}.pkl")
+
+def _load_estimator_safetensors(tensor_file: str, metadata_file: str):
+    """Rebuild an estimator from a safetensors file and its JSON sidecar"""
+    with open(metadata_file) as f:
+        metadata = json.load(f)
+    
+    # Only reconstruct scikit-learn classes named by the sidecar
+    if not metadata["module"].startswith("sklearn."):
+        raise ValueError(f"Refusing to load estimator from module {metadata['module']}")
+    
+    estimator_class = getattr(importlib.import_module(metadata["module"]), metadata["class"])
+    params = {
+        key: tuple(value) if isinstance(value, list) else value
+        for key, value in metadata["params"].items()
+    }
+    estimator = estimator_class(**params)
+    
+    for key, value in metadata["fitted"].items():
+        setattr(estimator, key, value)
+    
+    with safe_open(tensor_file, framework="numpy") as f:
+        for key in f.keys():
+            setattr(estimator, key, f.get_tensor(key))
+    
+    return estimator
+
+def _load_estimator(entries: Dict[str, str], stem: str):
+    """Load an estimator saved by save_models, preferring safetensors over joblib.
+    
+    `entries` maps file names in the model directory to their paths.
+    """
+    tensor_file = entries.get(f"{stem}.safetensors")
+    metadata_file = entries.get(f"{stem}.json")
+    if SAFETENSORS_AVAILABLE and tensor_file and metadata_file:
+        return _load_estimator_safetensors(tensor_file, metadata_file)
+    
+    pickle_file = entries.get(f"{stem}.pkl")
+    if pickle_file:
+        return _load_joblib(pickle_file)
+    
+    return None
+
+def _file_digest(path: str) -> str:
+    """SHA-256 hex digest of a file, read in 1 MB chunks"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+if NUMBA_AVAILABLE:
+    @njit(fastmath=True, parallel=True, cache=True)
+    def _fused_linear_predict(X, mean, scale, coef, intercept, out):
+        """Standardize and apply a linear model in one pass, without an X_scaled temporary"""
+        for i in prange(X.shape[0]):
+            acc = intercept[0]
+            for j in range(X.shape[1]):
+                acc += (X[i, j] - mean[j]) / scale[j] * coef[0, j]
+            out[i] = acc
+
 @dataclass
 class EnvironmentalConditions:
     """Environmental conditions for a farm"""
@@ -54,6 +274,43 @@ class EnvironmentalConditions:
     altitude: float
     climate_risk_score: float
 
+# Feature layouts, resolved once so featurization is a single C-level attrgetter call
+_ENV_FIELDS = (
+    "temperature_avg", "temperature_range", "annual_rainfall", "rainfall_variability",
+    "humidity_avg", "soil_ph", "soil_organic_matter", "soil_nitrogen", "soil_phosphorus",
+    "soil_potassium", "soil_texture_score", "drainage_score", "altitude", "climate_risk_score"
+)
+_ENV_GETTER = attrgetter(*_ENV_FIELDS)
+_ENV_FEATURE_COUNT = len(_ENV_FIELDS) + 1  # plus a placeholder for additional features
+
+_SEED_FIELDS = (
+    "maturity_days", "yield_potential", "drought_tolerance", "flood_tolerance",
+    "heat_tolerance", "cold_tolerance", "preferred_ph_min", "preferred_ph_max",
+    "min_rainfall", "max_rainfall"
+)
+_SEED_GETTER = attrgetter(*_SEED_FIELDS)
+# Fallbacks for missing seed values; None keeps the raw value
+_SEED_DEFAULTS = (120, 2.0, None, None, None, None, 6.0, 7.0, 500, 1200)
+
+# Packed record layout for bulk seed scoring; every field is float32 so a
+# batch of records can be viewed as an (N, 10) feature matrix without copying
+SEED_DTYPE = np.dtype([(name, np.float32) for name in _SEED_FIELDS]) if ML_AVAILABLE else None
+
+def _seed_feature_values(seed: Seed) -> Tuple:
+    """Seed feature values in _SEED_FIELDS order, with defaults applied"""
+    return tuple(
+        value if default is None else (value or default)
+        for value, default in zip(_SEED_GETTER(seed), _SEED_DEFAULTS)
+    )
+
+def _seeds_to_array(seeds: List[Seed]) -> Optional[object]:
+    """Pack seeds into a SEED_DTYPE structured array in a single pass"""
+    return np.fromiter((_seed_feature_values(seed) for seed in seeds), dtype=SEED_DTYPE, count=len(seeds))
+
+def _seeds_matrix(seed_array) -> Optional[object]:
+    """Zero-copy (N, 10) float32 view of a SEED_DTYPE array"""
+    return seed_array.view(np.float32).reshape(-1, len(_SEED_FIELDS))
+
 @dataclass
 class SeedCompatibility:
     """Seed compatibility analysis result"""
@@ -79,6 +336,13 @@ class SeedRecommendationEngine:
         self.scalers = {}
         self.is_trained = False
         
+        # Contiguous (mean, scale, coef, intercept) arrays for linear models,
+        # used by the fused Numba predict path
+        self._linear_params = {}
+        
+        # Native treelite predictors compiled from the tree ensembles at load time
+        self._compiled_models = {}
+        
         # Use fallback mode if ML packages are not available
         self.use_fallback = not ML_AVAILABLE
         
@@ -148,8 +412,9 @@ class SeedRecommendationEngine:
             env_features = self._extract_environmental_features(training_data)
             seed_features = self._extract_seed_features(training_data)
             
-            # Combine features
-            X = np.concatenate([env_features, seed_features], axis=1)
+            # Combine features; float32 end-to-end halves memory traffic and
+            # keeps the fitted scaler from upcasting inputs at predict time
+            X = np.concatenate([env_features, seed_features], axis=1).astype(np.float32)
             
             # Prepare targets
             y_yield = training_data["yield_achieved"].values
@@ -200,6 +465,9 @@ class SeedRecommendationEngine:
             model_performance["risk_r2"] = r2_score(y_risk_test, risk_pred)
             
             self.is_trained = True
+            self._cache_linear_params()
+            # Compiled predictors belong to the previously loaded estimators
+            self._compiled_models = {}
             logger.info("Model training completed successfully")
             
             return model_performance
@@ -217,10 +485,20 @@ class SeedRecommendationEngine:
             # Get environmental conditions
             env_conditions = self._analyze_environmental_conditions(farm, season, year)
             
+            # Predict yields for all candidate seeds in one batched model call
+            yield_predictions = {}
+            if ML_AVAILABLE and self.is_trained and available_seeds:
+                try:
+                    yield_predictions = self._predict_yields_batch(available_seeds, env_conditions)
+                except Exception as e:
+                    logger.error(f"Error in batched yield prediction: {e}")
+            
             # Analyze each seed
             recommendations = []
             for seed in available_seeds:
-                compatibility = self._analyze_seed_compatibility(seed, env_conditions, farm, preferences)
+                compatibility = self._analyze_seed_compatibility(
+                    seed, env_conditions, farm, preferences, yield_predictions.get(seed.id)
+                )
                 recommendations.append(compatibility)
             
             # Sort by compatibility score
@@ -284,7 +562,8 @@ class SeedRecommendationEngine:
             )
     
     def _analyze_seed_compatibility(self, seed: Seed, env_conditions: EnvironmentalConditions, 
-                                  farm: Farm, preferences: Dict = None) -> SeedCompatibility:
+                                  farm: Farm, preferences: Dict = None,
+                                  predicted_yield: Optional[float] = None) -> SeedCompatibility:
         """Analyze compatibility between a seed and environmental conditions"""
         try:
             # Climate compatibility analysis
@@ -294,7 +573,9 @@ class SeedRecommendationEngine:
             soil_score = self._calculate_soil_compatibility(seed, env_conditions)
             
             # Yield prediction
-            if self.is_trained:
+            if predicted_yield is not None:
+                yield_prediction = predicted_yield
+            elif self.is_trained:
                 yield_prediction = self._predict_yield(seed, env_conditions)
             else:
                 yield_prediction = self._estimate_yield_simple(seed, env_conditions)
@@ -491,9 +772,8 @@ class SeedRecommendationEngine:
             seed_features = self._seed_to_features(seed)
             
             features = np.concatenate([env_features, seed_features]).reshape(1, -1)
-            features_scaled = self.scalers["environmental"].transform(features)
             
-            predicted_yield = self.models["yield_predictor"].predict(features_scaled)[0]
+            predicted_yield = self._predict_scaled("yield_predictor", features)[0]
             
             # Ensure reasonable bounds
             max_yield = seed.yield_potential or 5.0
@@ -503,6 +783,113 @@ class SeedRecommendationEngine:
             logger.error(f"Error predicting yield: {e}")
             return self._estimate_yield_simple(seed, env_conditions)
     
+    def _predict_yields_batch(self, seeds: List[Seed], env_conditions: EnvironmentalConditions) -> Dict[int, float]:
+        """Predict yields for many seeds under the same conditions with one model call"""
+        seed_matrix = _seeds_matrix(_seeds_to_array(seeds))
+        env_features = self._environmental_conditions_to_features(env_conditions)
+        
+        # Seeds with a missing tolerance have NaN features, which the model
+        # rejects; like _predict_yield, fall back to the simple estimate for them
+        complete = np.isfinite(seed_matrix).all(axis=1)
+        predictions = {
+            seed.id: self._estimate_yield_simple(seed, env_conditions)
+            for seed, ok in zip(seeds, complete.tolist()) if not ok
+        }
+        if not complete.any():
+            return predictions
+        
+        model_seeds = [seed for seed, ok in zip(seeds, complete.tolist()) if ok]
+        features = np.hstack([
+            np.broadcast_to(env_features, (len(model_seeds), env_features.shape[0])),
+            seed_matrix[complete]
+        ])
+        predicted = self._predict_scaled("yield_predictor", features)
+        
+        # Same bounds as _predict_yield
+        max_yields = np.fromiter(
+            ((seed.yield_potential or 5.0) * 1.2 for seed in model_seeds), dtype=np.float32, count=len(model_seeds)
+        )
+        bounded = np.maximum(0.1, np.minimum(predicted, max_yields))
+        
+        predictions.update((seed.id, float(value)) for seed, value in zip(model_seeds, bounded))
+        return predictions
+    
+    def _predict_scaled(self, name: str, features) -> object:
+        """Scale features and predict with a model, fusing both steps for linear models"""
+        linear_params = self._linear_params.get(name)
+        if linear_params is not None:
+            out = np.empty(features.shape[0], dtype=np.float32)
+            _fused_linear_predict(features.astype(np.float32, copy=False), *linear_params, out)
+            return out
+        
+        features_scaled = self.scalers["environmental"].transform(features)
+        
+        compiled_model = self._compiled_models.get(name)
+        if compiled_model is not None:
+            return compiled_model.predict(treelite_runtime.DMatrix(features_scaled))
+        
+        return self.models[name].predict(features_scaled)
+    
+    def _cache_linear_params(self):
+        """Cache contiguous float32 parameters for linear regressors behind the environmental scaler"""
+        self._linear_params = {}
+        if not NUMBA_AVAILABLE:
+            return
+        
+        scaler = self.scalers.get("environmental")
+        if getattr(scaler, "mean_", None) is None or getattr(scaler, "scale_", None) is None:
+            return
+        
+        mean = np.ascontiguousarray(scaler.mean_, dtype=np.float32)
+        scale = np.ascontiguousarray(scaler.scale_, dtype=np.float32)
+        
+        for name, model in self.models.items():
+            # Classifiers threshold the decision function, so only regressors qualify
+            if not hasattr(model, "coef_") or not hasattr(model, "intercept_") or hasattr(model, "classes_"):
+                continue
+            coef = np.ascontiguousarray(np.atleast_2d(model.coef_), dtype=np.float32)
+            if coef.shape != (1, mean.shape[0]):
+                continue
+            intercept = np.ascontiguousarray(np.atleast_1d(model.intercept_), dtype=np.float32)
+            self._linear_params[name] = (mean, scale, coef, intercept)
+    
+    def _compile_tree_models(self, entries: Dict[str, str]):
+        """Serve fitted tree ensembles loaded from disk through treelite predictors.
+        
+        Libraries are cached in MODEL_LIB_DIR under the model file's hash, so
+        gcc only runs the first time a given model file is seen.
+        """
+        self._compiled_models = {}
+        if not TREELITE_AVAILABLE:
+            return
+        
+        for name, model in self.models.items():
+            if not isinstance(model, (RandomForestRegressor, GradientBoostingRegressor)):
+                continue
+            # Unfitted models (no model file on disk) have nothing to compile
+            model_file = entries.get(f"{name}.pkl")
+            if model_file is None or getattr(model, "estimators_", None) is None:
+                continue
+            try:
+                key = f"{name}-{treelite.__version__}-{_file_digest(model_file)[:16]}"
+                libpath = os.path.join(MODEL_LIB_DIR, f"{key}.so")
+                if not os.path.exists(libpath):
+                    os.makedirs(MODEL_LIB_DIR, exist_ok=True)
+                    # Build under a per-process name and rename into place, so
+                    # workers starting together never load a half-written library
+                    tmp_path = os.path.join(MODEL_LIB_DIR, f"{key}.{os.getpid()}.tmp.so")
+                    try:
+                        treelite_model = treelite.sklearn.import_model(model)
+                        treelite_model.export_lib(toolchain="gcc", libpath=tmp_path, params={"parallel_comp": 8})
+                        os.replace(tmp_path, libpath)
+                    finally:
+                        if os.path.exists(tmp_path):
+                            os.remove(tmp_path)
+                self._compiled_models[name] = treelite_runtime.Predictor(libpath)
+            except Exception as e:
+                # Keep serving the sklearn model, e.g. when no compiler is available
+                logger.warning(f"Could not compile {name} with treelite: {e}")
+    
     def _estimate_yield_simple(self, seed: Seed, env_conditions: EnvironmentalConditions) -> float:
         """Simple yield estimation based on compatibility scores"""
         try:
@@ -703,38 +1090,13 @@ class SeedRecommendationEngine:
     
     def _environmental_conditions_to_features(self, env_conditions: EnvironmentalConditions) -> Optional[object]:
         """Convert environmental conditions to feature array"""
-        return np.array([
-            env_conditions.temperature_avg,
-            env_conditions.temperature_range,
-            env_conditions.annual_rainfall,
-            env_conditions.rainfall_variability,
-            env_conditions.humidity_avg,
-            env_conditions.soil_ph,
-            env_conditions.soil_organic_matter,
-            env_conditions.soil_nitrogen,
-            env_conditions.soil_phosphorus,
-            env_conditions.soil_potassium,
-            env_conditions.soil_texture_score,
-            env_conditions.drainage_score,
-            env_conditions.altitude,
-            env_conditions.climate_risk_score,
-            0  # Placeholder for additional features
-        ])
+        features = np.zeros(_ENV_FEATURE_COUNT, dtype=np.float32)
+        features[:len(_ENV_FIELDS)] = _ENV_GETTER(env_conditions)
+        return features
     
     def _seed_to_features(self, seed: Seed) -> Optional[object]:
         """Convert seed characteristics to feature array"""
-        return np.array([
-            seed.maturity_days or 120,
-            seed.yield_potential or 2.0,
-            seed.drought_tolerance,
-            seed.flood_tolerance,
-            seed.heat_tolerance,
-            seed.cold_tolerance,
-            seed.preferred_ph_min or 6.0,
-            seed.preferred_ph_max or 7.0,
-            seed.min_rainfall or 500,
-            seed.max_rainfall or 1200
-        ])
+        return np.array(_seed_feature_values(seed), dtype=np.float32)
     
     def save_models(self, model_path: str = "./models"):
         """Save trained models to disk"""
@@ -742,32 +1104,40 @@ class SeedRecommendationEngine:
             os.makedirs(model_path, exist_ok=True)
             
             for name, model in self.models.items():
-                joblib.dump(model, os.path.join(model_path, f"{name}.pkl"))
+                _save_estimator(model, model_path, name)
             
             for name, scaler in self.scalers.items():
-                joblib.dump(scaler, os.path.join(model_path, f"{name}_scaler.pkl"))
+                _save_estimator(scaler, model_path, f"{name}_scaler")
             
-            logger.info(f"Models saved to {model_path}")
+            logger.info("Models saved to %s", model_path)
             
-        except Exception as e:
-            logger.error(f"Error saving models: {e}")
+        except OSError as e:
+            logger.error("Error saving models: %s", e)
     
     def load_models(self, model_path: str = "./models"):
         """Load trained models from disk"""
         try:
+            # One directory listing instead of a stat() per candidate file
+            with os.scandir(model_path) as it:
+                entries = {entry.name: entry.path for entry in it if entry.is_file()}
+            
             for name in self.models.keys():
-                model_file = os.path.join(model_path, f"{name}.pkl")
-                if os.path.exists(model_file):
-                    self.models[name] = joblib.load(model_file)
+                model = _load_estimator(entries, name)
+                if model is not None:
+                    self.models[name] = model
             
             for name in self.scalers.keys():
-                scaler_file = os.path.join(model_path, f"{name}_scaler.pkl")
-                if os.path.exists(scaler_file):
-                    self.scalers[name] = joblib.load(scaler_file)
+                scaler = _load_estimator(entries, f"{name}_scaler")
+                if scaler is not None:
+                    self.scalers[name] = scaler
             
             self.is_trained = True
-            logger.info(f"Models loaded from {model_path}")
-            
-        except Exception as e:
-            logger.error(f"Error loading models: {e}")
+            self._cache_linear_params()
+            self._compile_tree_models(entries)
+            logger.info("Models loaded from %s", model_path)
+            
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError) as e:
+            # Missing or corrupt model files; anything else propagates so the
+            # worker fails loudly instead of silently serving untrained models
+            logger.error("Error loading models: %s", e)
             self.is_trained = False
\ No newline at end of file
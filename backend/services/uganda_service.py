@@ -2,24 +2,111 @@
 Uganda-specific geographical and agricultural data service
 Provides real coordinates and regional information for API integration
 """
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
-from enum import Enum
+from bisect import bisect_left, bisect_right
+from dataclasses import asdict, dataclass, replace
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+from enum import IntEnum
+from types import MappingProxyType
+import json
+import math
+import sys
 
-class UgandaRegion(str, Enum):
-    CENTRAL = "Central"
-    WESTERN = "Western"
-    EASTERN = "Eastern"
-    NORTHERN = "Northern"
+# Mean Earth radius, for great-circle distances
+EARTH_RADIUS_KM = 6371.0
 
-class ClimateZone(str, Enum):
-    LAKE_VICTORIA_BASIN = "Lake Victoria Basin"
-    CENTRAL_PLATEAU = "Central Plateau"
-    WESTERN_HIGHLANDS = "Western Highlands"
-    NORTHERN_SAVANNA = "Northern Savanna"
-    EASTERN_HIGHLANDS = "Eastern Highlands"
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
 
-@dataclass
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+except ImportError:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+try:
+    from scipy.spatial import cKDTree
+    HAS_KDTREE = HAS_NUMPY
+except ImportError:
+    cKDTree = None
+    HAS_KDTREE = False
+
+try:
+    from numba import njit
+    HAS_NUMBA = HAS_NUMPY
+except ImportError:
+    HAS_NUMBA = False
+    
+    def njit(*args, **kwargs):
+        """Run kernels as plain Python when numba is not available"""
+        def decorator(func):
+            return func
+        return decorator
+
+@njit(cache=True)
+def _nearest_idx(lats, lons, q_lat, q_lon):
+    """Index of the (lat, lon) pair closest to the query point by squared planar distance"""
+    best = 0
+    best_d = 1e30
+    for i in range(lats.size):
+        dlat = lats[i] - q_lat
+        dlon = lons[i] - q_lon
+        d = dlat * dlat + dlon * dlon
+        if d < best_d:
+            best_d = d
+            best = i
+    return best
+
+class _LabeledEnum(IntEnum):
+    """Int-valued enum whose members carry a human-readable label for serialization"""
+    def __new__(cls, value: int, label: str):
+        member = int.__new__(cls, value)
+        member._value_ = value
+        member._label = label
+        return member
+    
+    @property
+    def label(self) -> str:
+        """Human-readable name, e.g. for API responses"""
+        return self._label
+    
+    @classmethod
+    def from_label(cls, label: str):
+        """Look up a member by its label; raises ValueError for unknown labels"""
+        for member in cls:
+            if member._label == label:
+                return member
+        raise ValueError(f"{label!r} is not a valid {cls.__name__}")
+
+class UgandaRegion(_LabeledEnum):
+    CENTRAL = 1, "Central"
+    WESTERN = 2, "Western"
+    EASTERN = 3, "Eastern"
+    NORTHERN = 4, "Northern"
+
+class ClimateZone(_LabeledEnum):
+    LAKE_VICTORIA_BASIN = 1, "Lake Victoria Basin"
+    CENTRAL_PLATEAU = 2, "Central Plateau"
+    WESTERN_HIGHLANDS = 3, "Western Highlands"
+    NORTHERN_SAVANNA = 4, "Northern Savanna"
+    EASTERN_HIGHLANDS = 5, "Eastern Highlands"
+
+@lru_cache(maxsize=256)
+def _normalize(name: str) -> str:
+    """Case-insensitive lookup key for a user-supplied location name"""
+    return name.casefold()
+
+def _shared_tuple(values, pool: Dict[Tuple[str, ...], Tuple[str, ...]]) -> Tuple[str, ...]:
+    """Tuple of interned strings, reusing an identical tuple already in `pool`"""
+    key = tuple(sys.intern(value) for value in values)
+    return pool.setdefault(key, key)
+
+@dataclass(slots=True, frozen=True)
 class UgandanLocation:
     """Ugandan location with agricultural context"""
     name: str
@@ -31,252 +118,381 @@ class UgandanLocation:
     elevation: float  # meters above sea level
     annual_rainfall_avg: int  # mm per year
     temperature_range: Tuple[float, float]  # (min, max) in Celsius
-    main_crops: List[str]
-    soil_types: List[str]
+    main_crops: Tuple[str, ...]
+    soil_types: Tuple[str, ...]
+
+# Locations with agricultural context, built once at import and shared
+# read-only by every UgandaLocationService
+_LOCATIONS = {
+    # Central Region
+    "kampala": UgandanLocation(
+        name="Kampala",
+        district="Kampala",
+        region=UgandaRegion.CENTRAL,
+        climate_zone=ClimateZone.LAKE_VICTORIA_BASIN,
+        latitude=0.3476,
+        longitude=32.5825,
+        elevation=1190,
+        annual_rainfall_avg=1200,
+        temperature_range=(16, 28),
+        main_crops=["maize", "beans", "banana", "sweet_potato"],
+        soil_types=["ferralsols", "acrisols"]
+    ),
+    "wakiso": UgandanLocation(
+        name="Wakiso",
+        district="Wakiso",
+        region=UgandaRegion.CENTRAL,
+        climate_zone=ClimateZone.CENTRAL_PLATEAU,
+        latitude=0.4044,
+        longitude=32.4597,
+        elevation=1200,
+        annual_rainfall_avg=1300,
+        temperature_range=(17, 27),
+        main_crops=["banana", "coffee", "maize", "beans"],
+        soil_types=["ferralsols", "nitisols"]
+    ),
+    "mukono": UgandanLocation(
+        name="Mukono",
+        district="Mukono",
+        region=UgandaRegion.CENTRAL,
+        climate_zone=ClimateZone.CENTRAL_PLATEAU,
+        latitude=0.3536,
+        longitude=32.7455,
+        elevation=1150,
+        annual_rainfall_avg=1250,
+        temperature_range=(16, 28),
+        main_crops=["banana", "coffee", "maize", "cassava"],
+        soil_types=["ferralsols", "acrisols"]
+    ),
+
+    # Western Region
+    "mbarara": UgandanLocation(
+        name="Mbarara",
+        district="Mbarara",
+        region=UgandaRegion.WESTERN,
+        climate_zone=ClimateZone.WESTERN_HIGHLANDS,
+        latitude=-0.6103,
+        longitude=30.6587,
+        elevation=1420,
+        annual_rainfall_avg=900,
+        temperature_range=(15, 27),
+        main_crops=["banana", "sorghum", "millet", "beans"],
+        soil_types=["acrisols", "lixisols"]
+    ),
+    "fort_portal": UgandanLocation(
+        name="Fort Portal",
+        district="Kabarole",
+        region=UgandaRegion.WESTERN,
+        climate_zone=ClimateZone.WESTERN_HIGHLANDS,
+        latitude=0.6645,
+        longitude=30.2746,
+        elevation=1540,
+        annual_rainfall_avg=1500,
+        temperature_range=(14, 25),
+        main_crops=["tea", "banana", "beans", "irish_potato"],
+        soil_types=["andosols", "nitisols"]
+    ),
+    "kasese": UgandanLocation(
+        name="Kasese",
+        district="Kasese",
+        region=UgandaRegion.WESTERN,
+        climate_zone=ClimateZone.WESTERN_HIGHLANDS,
+        latitude=0.1833,
+        longitude=30.0833,
+        elevation=950,
+        annual_rainfall_avg=1000,
+        temperature_range=(16, 30),
+        main_crops=["cotton", "maize", "beans", "cassava"],
+        soil_types=["vertisols", "fluvisols"]
+    ),
+
+    # Eastern Region
+    "jinja": UgandanLocation(
+        name="Jinja",
+        district="Jinja",
+        region=UgandaRegion.EASTERN,
+        climate_zone=ClimateZone.LAKE_VICTORIA_BASIN,
+        latitude=0.4244,
+        longitude=33.2042,
+        elevation=1134,
+        annual_rainfall_avg=1200,
+        temperature_range=(17, 29),
+        main_crops=["sugarcane", "banana", "maize", "rice"],
+        soil_types=["ferralsols", "fluvisols"]
+    ),
+    "mbale": UgandanLocation(
+        name="Mbale",
+        district="Mbale",
+        region=UgandaRegion.EASTERN,
+        climate_zone=ClimateZone.EASTERN_HIGHLANDS,
+        latitude=1.0827,
+        longitude=34.1758,
+        elevation=1200,
+        annual_rainfall_avg=1300,
+        temperature_range=(15, 26),
+        main_crops=["arabica_coffee", "banana", "beans", "maize"],
+        soil_types=["andosols", "nitisols"]
+    ),
+    "soroti": UgandanLocation(
+        name="Soroti",
+        district="Soroti",
+        region=UgandaRegion.EASTERN,
+        climate_zone=ClimateZone.NORTHERN_SAVANNA,
+        latitude=1.7147,
+        longitude=33.6111,
+        elevation=1140,
+        annual_rainfall_avg=900,
+        temperature_range=(18, 32),
+        main_crops=["sorghum", "millet", "groundnuts", "cassava"],
+        soil_types=["lixisols", "plinthosols"]
+    ),
+
+    # Northern Region
+    "gulu": UgandanLocation(
+        name="Gulu",
+        district="Gulu",
+        region=UgandaRegion.NORTHERN,
+        climate_zone=ClimateZone.NORTHERN_SAVANNA,
+        latitude=2.7794,
+        longitude=32.2992,
+        elevation=1100,
+        annual_rainfall_avg=1100,
+        temperature_range=(19, 33),
+        main_crops=["sorghum", "millet", "groundnuts", "sesame"],
+        soil_types=["acrisols", "lixisols"]
+    ),
+    "lira": UgandanLocation(
+        name="Lira",
+        district="Lira",
+        region=UgandaRegion.NORTHERN,
+        climate_zone=ClimateZone.NORTHERN_SAVANNA,
+        latitude=2.2490,
+        longitude=32.8999,
+        elevation=1060,
+        annual_rainfall_avg=1200,
+        temperature_range=(18, 31),
+        main_crops=["rice", "sorghum", "groundnuts", "beans"],
+        soil_types=["plinthosols", "acrisols"]
+    ),
+    "arua": UgandanLocation(
+        name="Arua",
+        district="Arua",
+        region=UgandaRegion.NORTHERN,
+        climate_zone=ClimateZone.NORTHERN_SAVANNA,
+        latitude=3.0197,
+        longitude=30.9108,
+        elevation=1200,
+        annual_rainfall_avg=1100,
+        temperature_range=(19, 32),
+        main_crops=["tobacco", "cassava", "beans", "groundnuts"],
+        soil_types=["lixisols", "acrisols"]
+    )
+}
+
+# Share interned crop/soil names, and identical tuples, across locations
+_tuple_pool = {}
+_LOCATIONS = {
+    key: replace(
+        location,
+        main_crops=_shared_tuple(location.main_crops, _tuple_pool),
+        soil_types=_shared_tuple(location.soil_types, _tuple_pool)
+    )
+    for key, location in _LOCATIONS.items()
+}
+del _tuple_pool
+
+# Major agricultural regions with typical coordinates for broader area queries
+_REGIONAL_CENTERS = {
+    UgandaRegion.CENTRAL: (0.3476, 32.5825),  # Kampala
+    UgandaRegion.WESTERN: (-0.6103, 30.6587),  # Mbarara
+    UgandaRegion.EASTERN: (1.0827, 34.1758),   # Mbale
+    UgandaRegion.NORTHERN: (2.7794, 32.2992)   # Gulu
+}
+
+# Climate-adapted crop varieties for Uganda
+_UGANDAN_CROP_VARIETIES = {
+    "maize": [
+        {"name": "Longe 5", "maturity_days": 120, "yield_potential": 6.0, "drought_tolerance": 0.7},
+        {"name": "Longe 10H", "maturity_days": 140, "yield_potential": 8.5, "drought_tolerance": 0.8},
+        {"name": "PH4", "maturity_days": 135, "yield_potential": 9.0, "drought_tolerance": 0.6},
+        {"name": "SC Duma 43", "maturity_days": 125, "yield_potential": 7.5, "drought_tolerance": 0.8}
+    ],
+    "beans": [
+        {"name": "NABE 15", "maturity_days": 90, "yield_potential": 2.5, "drought_tolerance": 0.8},
+        {"name": "NABE 14", "maturity_days": 85, "yield_potential": 2.2, "drought_tolerance": 0.7},
+        {"name": "K20", "maturity_days": 95, "yield_potential": 2.8, "drought_tolerance": 0.6},
+        {"name": "NABE 12C", "maturity_days": 80, "yield_potential": 2.0, "drought_tolerance": 0.9}
+    ],
+    "cassava": [
+        {"name": "NAROCASS 1", "maturity_days": 365, "yield_potential": 25.0, "drought_tolerance": 0.9},
+        {"name": "TME 14", "maturity_days": 330, "yield_potential": 22.0, "drought_tolerance": 0.8},
+        {"name": "Magana", "maturity_days": 300, "yield_potential": 18.0, "drought_tolerance": 0.7}
+    ],
+    "sweet_potato": [
+        {"name": "NASPOT 10 O", "maturity_days": 120, "yield_potential": 20.0, "drought_tolerance": 0.7},
+        {"name": "NASPOT 11", "maturity_days": 135, "yield_potential": 25.0, "drought_tolerance": 0.6},
+        {"name": "Ejumula", "maturity_days": 150, "yield_potential": 15.0, "drought_tolerance": 0.8}
+    ],
+    "groundnuts": [
+        {"name": "Serenut 5R", "maturity_days": 105, "yield_potential": 2.5, "drought_tolerance": 0.8},
+        {"name": "Red Beauty", "maturity_days": 95, "yield_potential": 2.2, "drought_tolerance": 0.9},
+        {"name": "Serenut 4T", "maturity_days": 110, "yield_potential": 2.8, "drought_tolerance": 0.7}
+    ]
+}
 
 class UgandaLocationService:
     """Service providing Uganda-specific geographical and agricultural data"""
     
     def __init__(self):
-        self.locations = {
-            # Central Region
-            "kampala": UgandanLocation(
-                name="Kampala",
-                district="Kampala",
-                region=UgandaRegion.CENTRAL,
-                climate_zone=ClimateZone.LAKE_VICTORIA_BASIN,
-                latitude=0.3476,
-                longitude=32.5825,
-                elevation=1190,
-                annual_rainfall_avg=1200,
-                temperature_range=(16, 28),
-                main_crops=["maize", "beans", "banana", "sweet_potato"],
-                soil_types=["ferralsols", "acrisols"]
-            ),
-            "wakiso": UgandanLocation(
-                name="Wakiso",
-                district="Wakiso",
-                region=UgandaRegion.CENTRAL,
-                climate_zone=ClimateZone.CENTRAL_PLATEAU,
-                latitude=0.4044,
-                longitude=32.4597,
-                elevation=1200,
-                annual_rainfall_avg=1300,
-                temperature_range=(17, 27),
-                main_crops=["banana", "coffee", "maize", "beans"],
-                soil_types=["ferralsols", "nitisols"]
-            ),
-            "mukono": UgandanLocation(
-                name="Mukono",
-                district="Mukono",
-                region=UgandaRegion.CENTRAL,
-                climate_zone=ClimateZone.CENTRAL_PLATEAU,
-                latitude=0.3536,
-                longitude=32.7455,
-                elevation=1150,
-                annual_rainfall_avg=1250,
-                temperature_range=(16, 28),
-                main_crops=["banana", "coffee", "maize", "cassava"],
-                soil_types=["ferralsols", "acrisols"]
-            ),
-            
-            # Western Region
-            "mbarara": UgandanLocation(
-                name="Mbarara",
-                district="Mbarara",
-                region=UgandaRegion.WESTERN,
-                climate_zone=ClimateZone.WESTERN_HIGHLANDS,
-                latitude=-0.6103,
-                longitude=30.6587,
-                elevation=1420,
-                annual_rainfall_avg=900,
-                temperature_range=(15, 27),
-                main_crops=["banana", "sorghum", "millet", "beans"],
-                soil_types=["acrisols", "lixisols"]
-            ),
-            "fort_portal": UgandanLocation(
-                name="Fort Portal",
-                district="Kabarole",
-                region=UgandaRegion.WESTERN,
-                climate_zone=ClimateZone.WESTERN_HIGHLANDS,
-                latitude=0.6645,
-                longitude=30.2746,
-                elevation=1540,
-                annual_rainfall_avg=1500,
-                temperature_range=(14, 25),
-                main_crops=["tea", "banana", "beans", "irish_potato"],
-                soil_types=["andosols", "nitisols"]
-            ),
-            "kasese": UgandanLocation(
-                name="Kasese",
-                district="Kasese",
-                region=UgandaRegion.WESTERN,
-                climate_zone=ClimateZone.WESTERN_HIGHLANDS,
-                latitude=0.1833,
-                longitude=30.0833,
-                elevation=950,
-                annual_rainfall_avg=1000,
-                temperature_range=(16, 30),
-                main_crops=["cotton", "maize", "beans", "cassava"],
-                soil_types=["vertisols", "fluvisols"]
-            ),
-            
-            # Eastern Region
-            "jinja": UgandanLocation(
-                name="Jinja",
-                district="Jinja",
-                region=UgandaRegion.EASTERN,
-                climate_zone=ClimateZone.LAKE_VICTORIA_BASIN,
-                latitude=0.4244,
-                longitude=33.2042,
-                elevation=1134,
-                annual_rainfall_avg=1200,
-                temperature_range=(17, 29),
-                main_crops=["sugarcane", "banana", "maize", "rice"],
-                soil_types=["ferralsols", "fluvisols"]
-            ),
-            "mbale": UgandanLocation(
-                name="Mbale",
-                district="Mbale",
-                region=UgandaRegion.EASTERN,
-                climate_zone=ClimateZone.EASTERN_HIGHLANDS,
-                latitude=1.0827,
-                longitude=34.1758,
-                elevation=1200,
-                annual_rainfall_avg=1300,
-                temperature_range=(15, 26),
-                main_crops=["arabica_coffee", "banana", "beans", "maize"],
-                soil_types=["andosols", "nitisols"]
-            ),
-            "soroti": UgandanLocation(
-                name="Soroti",
-                district="Soroti",
-                region=UgandaRegion.EASTERN,
-                climate_zone=ClimateZone.NORTHERN_SAVANNA,
-                latitude=1.7147,
-                longitude=33.6111,
-                elevation=1140,
-                annual_rainfall_avg=900,
-                temperature_range=(18, 32),
-                main_crops=["sorghum", "millet", "groundnuts", "cassava"],
-                soil_types=["lixisols", "plinthosols"]
-            ),
-            
-            # Northern Region
-            "gulu": UgandanLocation(
-                name="Gulu",
-                district="Gulu",
-                region=UgandaRegion.NORTHERN,
-                climate_zone=ClimateZone.NORTHERN_SAVANNA,
-                latitude=2.7794,
-                longitude=32.2992,
-                elevation=1100,
-                annual_rainfall_avg=1100,
-                temperature_range=(19, 33),
-                main_crops=["sorghum", "millet", "groundnuts", "sesame"],
-                soil_types=["acrisols", "lixisols"]
-            ),
-            "lira": UgandanLocation(
-                name="Lira",
-                district="Lira",
-                region=UgandaRegion.NORTHERN,
-                climate_zone=ClimateZone.NORTHERN_SAVANNA,
-                latitude=2.2490,
-                longitude=32.8999,
-                elevation=1060,
-                annual_rainfall_avg=1200,
-                temperature_range=(18, 31),
-                main_crops=["rice", "sorghum", "groundnuts", "beans"],
-                soil_types=["plinthosols", "acrisols"]
-            ),
-            "arua": UgandanLocation(
-                name="Arua",
-                district="Arua",
-                region=UgandaRegion.NORTHERN,
-                climate_zone=ClimateZone.NORTHERN_SAVANNA,
-                latitude=3.0197,
-                longitude=30.9108,
-                elevation=1200,
-                annual_rainfall_avg=1100,
-                temperature_range=(19, 32),
-                main_crops=["tobacco", "cassava", "beans", "groundnuts"],
-                soil_types=["lixisols", "acrisols"]
-            )
-        }
+        # Shared, read-only reference data
+        self.locations = MappingProxyType(_LOCATIONS)
+        self.regional_centers = MappingProxyType(_REGIONAL_CENTERS)
+        self.ugandan_crop_varieties = MappingProxyType(_UGANDAN_CROP_VARIETIES)
         
-        # Major agricultural regions with typical coordinates for broader area queries
-        self.regional_centers = {
-            UgandaRegion.CENTRAL: (0.3476, 32.5825),  # Kampala
-            UgandaRegion.WESTERN: (-0.6103, 30.6587),  # Mbarara
-            UgandaRegion.EASTERN: (1.0827, 34.1758),   # Mbale
-            UgandaRegion.NORTHERN: (2.7794, 32.2992)   # Gulu
-        }
+        # Struct-of-arrays view of the varieties per crop, for vectorized scoring
+        self.variety_arrays = MappingProxyType({
+            crop: self._variety_columns(varieties)
+            for crop, varieties in _UGANDAN_CROP_VARIETIES.items()
+        })
         
-        # Climate-adapted crop varieties for Uganda
-        self.ugandan_crop_varieties = {
-            "maize": [
-                {"name": "Longe 5", "maturity_days": 120, "yield_potential": 6.0, "drought_tolerance": 0.7},
-                {"name": "Longe 10H", "maturity_days": 140, "yield_potential": 8.5, "drought_tolerance": 0.8},
-                {"name": "PH4", "maturity_days": 135, "yield_potential": 9.0, "drought_tolerance": 0.6},
-                {"name": "SC Duma 43", "maturity_days": 125, "yield_potential": 7.5, "drought_tolerance": 0.8}
-            ],
-            "beans": [
-                {"name": "NABE 15", "maturity_days": 90, "yield_potential": 2.5, "drought_tolerance": 0.8},
-                {"name": "NABE 14", "maturity_days": 85, "yield_potential": 2.2, "drought_tolerance": 0.7},
-                {"name": "K20", "maturity_days": 95, "yield_potential": 2.8, "drought_tolerance": 0.6},
-                {"name": "NABE 12C", "maturity_days": 80, "yield_potential": 2.0, "drought_tolerance": 0.9}
-            ],
-            "cassava": [
-                {"name": "NAROCASS 1", "maturity_days": 365, "yield_potential": 25.0, "drought_tolerance": 0.9},
-                {"name": "TME 14", "maturity_days": 330, "yield_potential": 22.0, "drought_tolerance": 0.8},
-                {"name": "Magana", "maturity_days": 300, "yield_potential": 18.0, "drought_tolerance": 0.7}
-            ],
-            "sweet_potato": [
-                {"name": "NASPOT 10 O", "maturity_days": 120, "yield_potential": 20.0, "drought_tolerance": 0.7},
-                {"name": "NASPOT 11", "maturity_days": 135, "yield_potential": 25.0, "drought_tolerance": 0.6},
-                {"name": "Ejumula", "maturity_days": 150, "yield_potential": 15.0, "drought_tolerance": 0.8}
-            ],
-            "groundnuts": [
-                {"name": "Serenut 5R", "maturity_days": 105, "yield_potential": 2.5, "drought_tolerance": 0.8},
-                {"name": "Red Beauty", "maturity_days": 95, "yield_potential": 2.2, "drought_tolerance": 0.9},
-                {"name": "Serenut 4T", "maturity_days": 110, "yield_potential": 2.8, "drought_tolerance": 0.7}
-            ]
+        # Case-folded keys so lookups are one hash probe regardless of casing
+        self._locations_ci = {key.casefold(): location for key, location in self.locations.items()}
+        
+        # Precomputed answers for the per-name/per-crop getters; the reference
+        # data is immutable, so each lookup is a single dict probe
+        self._suitable_crops = {key: location.main_crops for key, location in self._locations_ci.items()}
+        self._crop_varieties = {crop: tuple(varieties) for crop, varieties in _UGANDAN_CROP_VARIETIES.items()}
+        
+        # Case-folded display names in sorted order, for prefix (autocomplete) queries
+        by_name = sorted(((location.name.casefold(), location) for location in self.locations.values()),
+                         key=lambda item: item[0])
+        self._sorted_names = [name for name, _ in by_name]
+        self._sorted_by_name = tuple(location for _, location in by_name)
+        
+        # Dict and serialized JSON forms per location, keyed like _locations_ci,
+        # so API responses skip per-request asdict() and serialization
+        self._location_dicts = {
+            key: self._location_payload(location)
+            for key, location in self._locations_ci.items()
         }
+        self._json_payloads = {key: _json_dumps(payload) for key, payload in self._location_dicts.items()}
+        
+        # Region and climate zone indexes; tuples so callers cannot mutate them
+        by_region = {}
+        by_zone = {}
+        for location in self.locations.values():
+            by_region.setdefault(location.region, []).append(location)
+            by_zone.setdefault(location.climate_zone, []).append(location)
+        self._by_region = {region: tuple(locations) for region, locations in by_region.items()}
+        self._by_zone = {zone: tuple(locations) for zone, locations in by_zone.items()}
+        
+        # Spatial index over (latitude, longitude) for nearest-location queries
+        self._loc_list = tuple(self.locations.values())
+        # (lat, lon, location) rows so the pure-Python scan unpacks instead of
+        # doing attribute lookups per location
+        self._coord_rows = tuple((loc.latitude, loc.longitude, loc) for loc in self._loc_list)
+        self._tree = None
+        if HAS_NUMPY:
+            self._lat = np.array([loc.latitude for loc in self._loc_list], dtype=np.float64)
+            self._lon = np.array([loc.longitude for loc in self._loc_list], dtype=np.float64)
+        if HAS_KDTREE:
+            self._coords = np.column_stack((self._lat, self._lon))
+            self._tree = cKDTree(self._coords)
+        
+        # Location indices sorted by latitude and by longitude, for bisecting bounding boxes
+        self._lat_sorted = sorted(range(len(self._loc_list)), key=lambda i: self._loc_list[i].latitude)
+        self._lat_keys = [self._loc_list[i].latitude for i in self._lat_sorted]
+        self._lon_sorted = sorted(range(len(self._loc_list)), key=lambda i: self._loc_list[i].longitude)
+        self._lon_keys = [self._loc_list[i].longitude for i in self._lon_sorted]
     
     def get_location(self, name: str) -> Optional[UgandanLocation]:
         """Get location data by name"""
-        return self.locations.get(name.lower())
+        return self._locations_ci.get(_normalize(name))
+    
+    def prefix_search(self, prefix: str) -> Tuple[UgandanLocation, ...]:
+        """Get locations whose name starts with `prefix` (case-insensitive), alphabetically"""
+        prefix = _normalize(prefix)
+        # Names sharing the prefix form one contiguous run of the sorted list
+        lo = bisect_left(self._sorted_names, prefix)
+        hi = bisect_left(self._sorted_names, prefix + "\U0010ffff", lo)
+        return self._sorted_by_name[lo:hi]
+    
+    def get_location_json(self, name: str) -> Optional[bytes]:
+        """Get a location's data as ready-to-send JSON bytes"""
+        return self._json_payloads.get(_normalize(name))
     
-    def get_locations_by_region(self, region: UgandaRegion) -> List[UgandanLocation]:
+    def get_location_dict(self, name: str) -> Optional[Dict]:
+        """Get a location's data as a JSON-ready dict (shared between calls; do not mutate)"""
+        return self._location_dicts.get(_normalize(name))
+    
+    @staticmethod
+    def _location_payload(location: UgandanLocation) -> Dict:
+        """JSON-ready dict for a location, with region and climate zone as labels"""
+        payload = asdict(location)
+        payload["region"] = location.region.label
+        payload["climate_zone"] = location.climate_zone.label
+        return payload
+    
+    def get_locations_by_region(self, region: UgandaRegion) -> Tuple[UgandanLocation, ...]:
         """Get all locations in a specific region"""
-        return [loc for loc in self.locations.values() if loc.region == region]
+        return self._by_region.get(region, ())
     
-    def get_locations_by_climate_zone(self, zone: ClimateZone) -> List[UgandanLocation]:
+    def get_locations_by_climate_zone(self, zone: ClimateZone) -> Tuple[UgandanLocation, ...]:
         """Get all locations in a specific climate zone"""
-        return [loc for loc in self.locations.values() if loc.climate_zone == zone]
+        return self._by_zone.get(zone, ())
     
     def get_regional_center(self, region: UgandaRegion) -> Tuple[float, float]:
         """Get the central coordinates for a region"""
         return self.regional_centers[region]
     
-    def get_suitable_crops(self, location_name: str) -> List[str]:
+    def get_suitable_crops(self, location_name: str) -> Tuple[str, ...]:
         """Get main crops suitable for a location"""
-        location = self.get_location(location_name)
-        return location.main_crops if location else []
+        return self._suitable_crops.get(_normalize(location_name), ())
     
-    def get_crop_varieties(self, crop_type: str) -> List[Dict]:
+    def get_crop_varieties(self, crop_type: str) -> Tuple[Dict, ...]:
         """Get Ugandan varieties for a specific crop"""
-        return self.ugandan_crop_varieties.get(crop_type, [])
+        return self._crop_varieties.get(crop_type, ())
+    
+    def get_variety_arrays(self, crop_type: str) -> Optional[Dict]:
+        """Get a crop's varieties as parallel arrays (names, maturity_days, yield_potential, drought_tolerance)"""
+        return self.variety_arrays.get(crop_type)
+    
+    @staticmethod
+    def _variety_columns(varieties: List[Dict]) -> Dict:
+        """Split a list of variety dicts into one read-only array per field"""
+        columns = {
+            "names": tuple(variety["name"] for variety in varieties),
+            "maturity_days": [variety["maturity_days"] for variety in varieties],
+            "yield_potential": [variety["yield_potential"] for variety in varieties],
+            "drought_tolerance": [variety["drought_tolerance"] for variety in varieties]
+        }
+        if not HAS_NUMPY:
+            return {key: tuple(values) for key, values in columns.items()}
+        
+        dtypes = {"maturity_days": np.int16, "yield_potential": np.float32, "drought_tolerance": np.float32}
+        for key, dtype in dtypes.items():
+            columns[key] = np.array(columns[key], dtype=dtype)
+            columns[key].flags.writeable = False
+        return columns
     
     def find_nearest_location(self, latitude: float, longitude: float) -> Optional[UgandanLocation]:
         """Find the nearest defined location to given coordinates"""
+        if self._tree is not None:
+            _, idx = self._tree.query([latitude, longitude], k=1)
+            return self._loc_list[idx]
+        if HAS_NUMBA:
+            return self._loc_list[_nearest_idx(self._lat, self._lon, latitude, longitude)]
+        if HAS_NUMPY:
+            return self.find_nearest_locations([latitude], [longitude])[0]
+        
         min_distance = float('inf')
         nearest_location = None
         
-        for location in self.locations.values():
-            # Simple Euclidean distance calculation
-            distance = ((latitude - location.latitude) ** 2 + 
-                       (longitude - location.longitude) ** 2) ** 0.5
+        for lat, lon, location in self._coord_rows:
+            # Squared Euclidean distance; sqrt is monotonic so the argmin is unchanged
+            dlat = latitude - lat
+            dlon = longitude - lon
+            distance = dlat * dlat + dlon * dlon
             
             if distance < min_distance:
                 min_distance = distance
@@ -284,13 +500,62 @@ class UgandaLocationService:
         
         return nearest_location
     
-    def get_all_locations(self) -> List[UgandanLocation]:
-        """Get all available locations"""
-        return list(self.locations.values())
+    def find_nearest_locations(self, latitudes, longitudes) -> List[UgandanLocation]:
+        """Find the nearest defined location for each of many coordinates"""
+        if not HAS_NUMPY:
+            return [self.find_nearest_location(lat, lon) for lat, lon in zip(latitudes, longitudes)]
+        
+        lats = np.asarray(latitudes, dtype=np.float64)
+        lons = np.asarray(longitudes, dtype=np.float64)
+        if self._tree is not None:
+            _, indices = self._tree.query(np.column_stack((lats, lons)), k=1)
+        else:
+            # (n_points, n_locations) squared distances; argmin keeps the first of any ties
+            d2 = (self._lat - lats[:, None]) ** 2 + (self._lon - lons[:, None]) ** 2
+            indices = d2.argmin(axis=1)
+        return [self._loc_list[i] for i in indices.tolist()]
+    
+    def locations_within_bbox(self, lat_lo: float, lat_hi: float,
+                              lon_lo: float, lon_hi: float) -> Tuple[UgandanLocation, ...]:
+        """Get all locations inside a latitude/longitude bounding box (inclusive)"""
+        in_lat = self._lat_sorted[bisect_left(self._lat_keys, lat_lo):bisect_right(self._lat_keys, lat_hi)]
+        in_lon = self._lon_sorted[bisect_left(self._lon_keys, lon_lo):bisect_right(self._lon_keys, lon_hi)]
+        return tuple(self._loc_list[i] for i in sorted(set(in_lat).intersection(in_lon)))
+    
+    def locations_within_radius_km(self, latitude: float, longitude: float,
+                                   radius_km: float) -> Tuple[UgandanLocation, ...]:
+        """Get all locations within a great-circle radius of a point"""
+        # Narrow to the enclosing bounding box, then check exact distances
+        angular_radius = radius_km / EARTH_RADIUS_KM
+        dlat = math.degrees(angular_radius)
+        ratio = math.sin(angular_radius) / max(math.cos(math.radians(latitude)), 1e-12)
+        # Caps reaching a pole (or a hemisphere) span every longitude
+        dlon = math.degrees(math.asin(ratio)) if angular_radius < math.pi / 2 and ratio < 1 else 180.0
+        candidates = self.locations_within_bbox(latitude - dlat, latitude + dlat,
+                                                longitude - dlon, longitude + dlon)
+        
+        lat1 = math.radians(latitude)
+        within = []
+        for location in candidates:
+            lat2 = math.radians(location.latitude)
+            a = (math.sin((lat2 - lat1) / 2) ** 2 +
+                 math.cos(lat1) * math.cos(lat2) * math.sin(math.radians(location.longitude - longitude) / 2) ** 2)
+            if 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a)) <= radius_km:
+                within.append(location)
+        return tuple(within)
+    
+    def get_all_locations(self) -> Sequence[UgandanLocation]:
+        """Get all available locations (read-only, shared between calls)"""
+        return self._loc_list
     
     def get_location_names(self) -> List[str]:
         """Get list of all location names"""
         return [loc.name for loc in self.locations.values()]
 
 # Global instance
-uganda_service = UgandaLocationService()
\ No newline at end of file
+uganda_service = UgandaLocationService()
+
+if HAS_NUMBA and uganda_service._tree is None:
+    # Compile the scan kernel (or load it from numba's cache) at import time;
+    # with a KD-tree available the kernel is never used
+    _nearest_idx(uganda_service._lat, uganda_service._lon, 0.0, 32.0)
\ No newline at end of file
@@ -0,0 +1,65 @@
+"""
+Tests for the climate service location weather cache
+"""
+import asyncio
+from datetime import datetime
+
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("requests")
+pytest.importorskip("dotenv")
+
+from services.climate_service import ClimateService, WeatherData, weather_service
+
+def _observed_weather() -> WeatherData:
+    return WeatherData(
+        temperature_min=18.0,
+        temperature_max=28.0,
+        temperature_avg=23.0,
+        rainfall=2.0,
+        humidity=70.0,
+        wind_speed=8.0,
+        date=datetime.now()
+    )
+
+@pytest.fixture
+def weather_api(monkeypatch):
+    """Replace the OpenWeather call with a switchable, call-counting double"""
+    state = {"fail": False, "calls": 0}
+    
+    def get_current_weather(latitude, longitude):
+        state["calls"] += 1
+        if state["fail"]:
+            return weather_service._generate_synthetic_weather(latitude, longitude)
+        return _observed_weather()
+    
+    monkeypatch.setattr(weather_service, "get_current_weather", get_current_weather)
+    return state
+
+def test_synthetic_fallback_is_not_cached(weather_api):
+    weather_api["fail"] = True
+    service = ClimateService()
+    
+    first = asyncio.run(service.get_weather_for_ugandan_location("Kampala"))
+    assert first.is_synthetic
+    
+    weather_api["fail"] = False
+    second = asyncio.run(service.get_weather_for_ugandan_location("Kampala"))
+    assert weather_api["calls"] == 2
+    assert not second.is_synthetic
+
+def test_observed_weather_is_cached_until_invalidated(weather_api):
+    service = ClimateService()
+    
+    first = asyncio.run(service.get_weather_for_ugandan_location("Gulu"))
+    assert asyncio.run(service.get_weather_for_ugandan_location("gulu")) is first
+    assert weather_api["calls"] == 1
+    
+    service.invalidate("GULU")
+    asyncio.run(service.get_weather_for_ugandan_location("Gulu"))
+    assert weather_api["calls"] == 2
+
+def test_unknown_location_returns_none(weather_api):
+    assert asyncio.run(ClimateService().get_weather_for_ugandan_location("Atlantis")) is None
+    assert weather_api["calls"] == 0
@@ -1,85 +1,116 @@
 """
 Test script to verify the dashboard API is working with real Uganda data
 """
-import requests
+import asyncio
+import io
+import sys
+import httpx
 import json
 
-def test_dashboard_api():
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+async def run_dashboard_checks():
     """Test the dashboard API endpoint for all user types"""
     base_url = "http://localhost:8000"
     
     # Test different user types
     test_users = [
         {"username": "farmer1", "password": "password123", "type": "farmer"},
-        {"username": "admin", "password": "admin123", "type": "admin"}, 
+        {"username": "admin", "password": "admin123", "type": "admin"},
         {"username": "policy1", "password": "policy123", "type": "policy_maker"}
     ]
     
-    print("=== Testing Dashboard API for All User Types ===\n")
+    # Collect the report in memory and write it to stdout in one go
+    buf = io.StringIO()
+    
+    def p(*args, **kwargs):
+        print(*args, **kwargs, file=buf)
     
-    for user_data in test_users:
-        print(f"Testing {user_data['type']}: {user_data['username']}")
+    p("=== Testing Dashboard API for All User Types ===\n")
+    
+    async def run_user(client, user_data):
+        """Log in and fetch the dashboard for one user; returns the lines to report"""
+        lines = [f"Testing {user_data['type']}: {user_data['username']}"]
+        
+        # Login to get token
+        login_response = await client.post(
+            "/api/auth/token",
+            data={"username": user_data["username"], "password": user_data["password"]},
+            headers={"Content-Type": "application/x-www-form-urlencoded"}
+        )
         
-        try:
-            # Login to get token
-            login_response = requests.post(
-                f"{base_url}/api/auth/token",
-                data={"username": user_data["username"], "password": user_data["password"]},
-                headers={"Content-Type": "application/x-www-form-urlencoded"}
-            )
+        if login_response.status_code == 200:
+            token_data = _json_loads(login_response.content)
+            access_token = token_data["access_token"]
+            lines.append(f"  ✅ Login successful")
             
-            if login_response.status_code == 200:
-                token_data = login_response.json()
-                access_token = token_data["access_token"]
-                print(f"  ✅ Login successful")
+            # Test dashboard endpoint
+            headers = {
+                "Authorization": f"Bearer {access_token}",
+                "Content-Type": "application/json"
+            }
+            
+            dashboard_response = await client.get("/api/analytics/dashboard", headers=headers)
+            
+            if dashboard_response.status_code == 200:
+                dashboard_data = _json_loads(dashboard_response.content)
+                lines.append(f"  ✅ Dashboard API successful!")
+                lines.append(f"      Total Farms: {dashboard_data.get('total_farms', 0)}")
+                lines.append(f"      Recommendations: {dashboard_data.get('total_recommendations', 0)}")
+                lines.append(f"      Active Cycles: {dashboard_data.get('active_crop_cycles', 0)}")
+                lines.append(f"      Climate Alerts: {dashboard_data.get('climate_alerts', 0)}")
                 
-                # Test dashboard endpoint
-                headers = {
-                    "Authorization": f"Bearer {access_token}",
-                    "Content-Type": "application/json"
-                }
+                # Show user-specific data
+                regional_stats = dashboard_data.get('regional_statistics', {})
+                lines.append(f"      Region/Role: {regional_stats.get('user_region', 'N/A')}")
                 
-                dashboard_response = requests.get(
-                    f"{base_url}/api/analytics/dashboard",
-                    headers=headers
-                )
+                recent_alerts = dashboard_data.get('recent_alerts', [])
+                if recent_alerts:
+                    lines.append(f"      Sample Alert: {recent_alerts[0].get('message', 'N/A')[:60]}...")
                 
-                if dashboard_response.status_code == 200:
-                    dashboard_data = dashboard_response.json()
-                    print(f"  ✅ Dashboard API successful!")
-                    print(f"      Total Farms: {dashboard_data.get('total_farms', 0)}")
-                    print(f"      Recommendations: {dashboard_data.get('total_recommendations', 0)}")
-                    print(f"      Active Cycles: {dashboard_data.get('active_crop_cycles', 0)}")
-                    print(f"      Climate Alerts: {dashboard_data.get('climate_alerts', 0)}")
-                    
-                    # Show user-specific data
-                    regional_stats = dashboard_data.get('regional_statistics', {})
-                    print(f"      Region/Role: {regional_stats.get('user_region', 'N/A')}")
-                    
-                    recent_alerts = dashboard_data.get('recent_alerts', [])
-                    if recent_alerts:
-                        print(f"      Sample Alert: {recent_alerts[0].get('message', 'N/A')[:60]}...")
-                    
-                    print(f"      Status: ✅ Working")
-                else:
-                    print(f"  ❌ Dashboard API failed: {dashboard_response.status_code}")
-                    print(f"      Response: {dashboard_response.text[:100]}...")
-                    
+                lines.append(f"      Status: ✅ Working")
             else:
-                print(f"  ❌ Login failed: {login_response.status_code}")
-                
-        except requests.exceptions.ConnectionError:
-            print(f"  ❌ Connection failed - Backend server not running?")
-            return False
-        except Exception as e:
-            print(f"  ❌ Error: {e}")
-            
-        print()  # Blank line between users
+                lines.append(f"  ❌ Dashboard API failed: {dashboard_response.status_code}")
+                lines.append(f"      Response: {dashboard_response.text[:100]}...")
+        
+        else:
+            lines.append(f"  ❌ Login failed: {login_response.status_code}")
+        
+        return lines
+    
+    # Run every user's login + dashboard round trip concurrently over one pooled client
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        results = await asyncio.gather(
+            *(run_user(client, user_data) for user_data in test_users),
+            return_exceptions=True
+        )
+    
+    # Report in user order once everything has finished
+    success = True
+    for user_data, result in zip(test_users, results):
+        if isinstance(result, httpx.ConnectError):
+            p(f"Testing {user_data['type']}: {user_data['username']}")
+            p(f"  ❌ Connection failed - Backend server not running?")
+            success = False
+            break
+        if isinstance(result, Exception):
+            p(f"Testing {user_data['type']}: {user_data['username']}")
+            p(f"  ❌ Error: {result}")
+        else:
+            p("\n".join(result))
         
-    return True
+        p()  # Blank line between users
+    
+    sys.stdout.write(buf.getvalue())
+    sys.stdout.flush()
+    return success
 
 if __name__ == "__main__":
-    success = test_dashboard_api()
+    success = asyncio.run(run_dashboard_checks())
     if success:
         print(f"✅ Dashboard API tests completed!")
         print(f"🌱 All user types (farmer, admin, policy maker) have working dashboards!")
@@ -0,0 +1,65 @@
+"""
+Save/load round-trip tests for recommendation engine model files
+"""
+import os
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("pandas")
+pytest.importorskip("sklearn")
+pytest.importorskip("joblib")
+pytest.importorskip("safetensors")
+
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.preprocessing import StandardScaler
+
+from services.recommendation_engine import _load_estimator, _save_estimator
+
+def _entries(model_path):
+    """Model directory listing in the shape load_models passes to _load_estimator"""
+    return {entry.name: entry.path for entry in os.scandir(model_path) if entry.is_file()}
+
+def _training_data():
+    rng = np.random.default_rng(42)
+    X = rng.random((50, 4)).astype(np.float32)
+    y = X @ np.array([1.0, 2.0, 3.0, 4.0], dtype=np.float32)
+    return X, y
+
+def test_flat_estimator_round_trips_through_safetensors(tmp_path):
+    X, _ = _training_data()
+    scaler = StandardScaler().fit(X)
+    
+    _save_estimator(scaler, str(tmp_path), "scaler")
+    assert set(os.listdir(tmp_path)) == {"scaler.safetensors", "scaler.json"}
+    
+    loaded = _load_estimator(_entries(tmp_path), "scaler")
+    assert isinstance(loaded, StandardScaler)
+    np.testing.assert_allclose(loaded.transform(X), scaler.transform(X))
+
+def test_tree_estimator_round_trips_through_joblib(tmp_path):
+    X, y = _training_data()
+    model = RandomForestRegressor(n_estimators=5, random_state=42).fit(X, y)
+    
+    _save_estimator(model, str(tmp_path), "model")
+    assert set(os.listdir(tmp_path)) == {"model.pkl"}
+    
+    loaded = _load_estimator(_entries(tmp_path), "model")
+    np.testing.assert_allclose(loaded.predict(X), model.predict(X))
+
+def test_switching_format_removes_stale_files(tmp_path):
+    X, y = _training_data()
+    
+    # A flat estimator followed by a pickled one under the same name...
+    _save_estimator(StandardScaler().fit(X), str(tmp_path), "model")
+    model = RandomForestRegressor(n_estimators=5, random_state=42).fit(X, y)
+    _save_estimator(model, str(tmp_path), "model")
+    
+    # ...must load the fresh pickle, not the old safetensors copy
+    assert set(os.listdir(tmp_path)) == {"model.pkl"}
+    assert isinstance(_load_estimator(_entries(tmp_path), "model"), RandomForestRegressor)
+    
+    # and switching back removes the pickle
+    _save_estimator(StandardScaler().fit(X), str(tmp_path), "model")
+    assert set(os.listdir(tmp_path)) == {"model.safetensors", "model.json"}
+    assert isinstance(_load_estimator(_entries(tmp_path), "model"), StandardScaler)
@@ -0,0 +1,96 @@
+"""
+Prediction-path tests for the seed recommendation engine
+"""
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("pandas")
+pytest.importorskip("sklearn")
+pytest.importorskip("joblib")
+pytest.importorskip("requests")
+pytest.importorskip("dotenv")
+
+from sklearn.linear_model import LinearRegression, Ridge
+from sklearn.preprocessing import StandardScaler
+
+from models.database_models import Seed
+from services.recommendation_engine import EnvironmentalConditions, SeedRecommendationEngine
+
+N_FEATURES = 25  # environmental + seed features
+
+def _training_data(n: int = 200):
+    rng = np.random.default_rng(42)
+    X = rng.normal(size=(n, N_FEATURES)).astype(np.float32) * 3 + 10
+    y = X @ rng.normal(size=N_FEATURES).astype(np.float32) + 2.0
+    return X, y
+
+@pytest.mark.parametrize("model_class", [LinearRegression, Ridge])
+def test_loaded_linear_model_uses_fused_kernel(tmp_path, model_class):
+    pytest.importorskip("numba")
+    X, y = _training_data()
+    scaler = StandardScaler().fit(X)
+    model = model_class().fit(scaler.transform(X), y)
+    
+    engine = SeedRecommendationEngine()
+    engine.models["yield_predictor"] = model
+    engine.scalers["environmental"] = scaler
+    engine.save_models(str(tmp_path))
+    
+    loaded = SeedRecommendationEngine()
+    loaded.load_models(str(tmp_path))
+    assert "yield_predictor" in loaded._linear_params
+    
+    expected = model.predict(scaler.transform(X))
+    np.testing.assert_allclose(loaded._predict_scaled("yield_predictor", X), expected, rtol=1e-4, atol=1e-3)
+
+def _trained_engine():
+    """Engine whose yield predictor is a small fitted tree ensemble"""
+    X, y = _training_data()
+    engine = SeedRecommendationEngine()
+    engine.scalers["environmental"] = StandardScaler().fit(X)
+    engine.models["yield_predictor"].set_params(n_estimators=10)
+    engine.models["yield_predictor"].fit(engine.scalers["environmental"].transform(X), y)
+    engine.is_trained = True
+    return engine
+
+def _seeds():
+    seeds = [
+        Seed(
+            id=i + 1,
+            variety_name=f"Test variety {i}",
+            maturity_days=90 + 10 * i,
+            yield_potential=2.0 + 0.5 * i,
+            drought_tolerance=0.2 + 0.1 * i,
+            flood_tolerance=0.3,
+            heat_tolerance=0.5,
+            cold_tolerance=0.4,
+            preferred_ph_min=5.5,
+            preferred_ph_max=7.0,
+            min_rainfall=600,
+            max_rainfall=1400
+        )
+        for i in range(6)
+    ]
+    # A seed with no recorded tolerance yields a NaN feature
+    seeds[0].drought_tolerance = None
+    return seeds
+
+def _conditions():
+    return EnvironmentalConditions(
+        temperature_avg=24.0, temperature_range=10.0, annual_rainfall=1100.0,
+        rainfall_variability=0.2, humidity_avg=70.0, soil_ph=6.2,
+        soil_organic_matter=3.0, soil_nitrogen=0.2, soil_phosphorus=25.0,
+        soil_potassium=150.0, soil_texture_score=0.8, drainage_score=0.7,
+        altitude=1200.0, climate_risk_score=0.3
+    )
+
+def test_batch_yield_prediction_matches_per_seed_path():
+    engine = _trained_engine()
+    seeds = _seeds()
+    conditions = _conditions()
+    
+    batched = engine._predict_yields_batch(seeds, conditions)
+    
+    assert set(batched) == {seed.id for seed in seeds}
+    for seed in seeds:
+        assert batched[seed.id] == pytest.approx(engine._predict_yield(seed, conditions), rel=1e-5)
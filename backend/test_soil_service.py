@@ -0,0 +1,131 @@
+"""
+Tests for the soil service caching and scoring paths
+"""
+import asyncio
+import random
+
+import pytest
+
+pytest.importorskip("requests")
+pytest.importorskip("dotenv")
+
+import services.soil_service as soil_module
+from services.soil_service import SoilData, SoilService, _ALL_DEFAULTS
+
+class _FakeResponse:
+    """Minimal stand-in for an httpx response"""
+    def __init__(self, content: bytes):
+        self.content = content
+    
+    def raise_for_status(self):
+        pass
+
+class _FakeClient:
+    """Async client double that counts requests and fails on demand"""
+    def __init__(self, fail: bool):
+        self.fail = fail
+        self.calls = 0
+    
+    async def get(self, url, params=None):
+        self.calls += 1
+        if self.fail:
+            raise ConnectionError("SoilGrids unreachable")
+        return _FakeResponse(b'{"properties": {"layers": [{"name": "phh2o", "depths": [{"values": {"mean": 62}}]}]}}')
+
+@pytest.fixture
+def fake_client(monkeypatch):
+    """Route SoilGrids through a fake client with empty, process-local soil caches"""
+    monkeypatch.setattr(soil_module, "_disk_cache", None)
+    monkeypatch.setattr(soil_module, "_soil_cache", {})
+    client = _FakeClient(fail=False)
+    monkeypatch.setattr(soil_module, "_async_client", client)
+    return client
+
+def test_failed_fetch_is_not_cached(fake_client):
+    fake_client.fail = True
+    service = SoilService()
+    
+    first = asyncio.run(service.get_soil_for_ugandan_location("Kampala"))
+    assert first.defaults_mask == _ALL_DEFAULTS
+    
+    # SoilGrids recovers; the synthetic fallback must not be served again
+    fake_client.fail = False
+    second = asyncio.run(service.get_soil_for_ugandan_location("kampala"))
+    assert fake_client.calls == 2
+    assert second.defaults_mask != _ALL_DEFAULTS
+    assert second.ph_level == pytest.approx(6.2)
+
+def test_successful_fetch_is_cached(fake_client):
+    service = SoilService()
+    
+    asyncio.run(service.get_soil_for_ugandan_location("Kampala"))
+    asyncio.run(service.get_soil_for_ugandan_location("KAMPALA"))
+    assert fake_client.calls == 1
+    
+    service.invalidate("Kampala")
+    asyncio.run(service.get_soil_for_ugandan_location("Kampala"))
+    assert fake_client.calls == 2
+
+def test_concurrent_requests_share_one_fetch(fake_client):
+    service = SoilService()
+    
+    async def fetch_many():
+        return await asyncio.gather(*(service.get_soil_for_ugandan_location("Gulu") for _ in range(5)))
+    
+    results = asyncio.run(fetch_many())
+    assert fake_client.calls == 1
+    assert all(result is results[0] for result in results)
+
+def test_unknown_location_returns_none(fake_client):
+    assert asyncio.run(SoilService().get_soil_for_ugandan_location("Atlantis")) is None
+    assert fake_client.calls == 0
+
+# Batch vs scalar parity
+
+def _random_soils(n=2000, seed=2):
+    """Soils spanning every texture and drainage class, plus unknown ones"""
+    rng = random.Random(seed)
+    service = soil_module.soil_analysis_service
+    textures = list(service.texture_classes) + ["unclassified"]
+    drainages = soil_module.DRAINAGE_CLASSES + ["unknown"]
+    return [
+        SoilData(
+            ph_level=rng.uniform(4.0, 9.0),
+            organic_matter=rng.uniform(0.5, 6.0),
+            nitrogen=rng.uniform(0.0, 80.0),
+            phosphorus=rng.uniform(0.0, 60.0),
+            potassium=rng.uniform(20.0, 300.0),
+            texture=rng.choice(textures),
+            drainage=rng.choice(drainages),
+            depth=rng.choice([10.0, 30.0, 60.0, 100.0, 150.0]),
+            salinity=0.2
+        )
+        for _ in range(n)
+    ]
+
+def test_batch_scores_match_scalar_scores():
+    np = pytest.importorskip("numpy")
+    service = soil_module.soil_analysis_service
+    soils = _random_soils()
+    
+    batch = service.score_locations_crops_batch(soils)
+    scalar = np.array([
+        [service.analyze_soil_suitability(soil, crop).suitability_score for crop in service._crop_names]
+        for soil in soils
+    ])
+    assert batch.shape == (len(soils), len(service._crop_names))
+    np.testing.assert_allclose(batch, scalar, rtol=0, atol=1e-9)
+
+def test_batch_texture_classes_match_scalar_classifier():
+    rng = random.Random(3)
+    service = soil_module.soil_analysis_service
+    triples = [(rng.uniform(0, 100), rng.uniform(0, 100), rng.uniform(0, 100)) for _ in range(5000)]
+    # SoilGrids resolution (0.1 %) and degenerate inputs
+    for _ in range(2000):
+        sand = rng.randint(0, 1000) / 10
+        silt = rng.randint(0, 1000 - int(sand * 10)) / 10
+        triples.append((sand, silt, 100 - sand - silt))
+    triples += [(0, 0, 0), (100, 0, 0), (0, 100, 0), (0, 0, 100), (33.3, 33.3, 33.4)]
+    
+    sand, silt, clay = zip(*triples)
+    assert service.classify_textures(sand, silt, clay) == [service._classify_texture(*triple) for triple in triples]
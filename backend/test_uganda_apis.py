@@ -2,6 +2,7 @@
 Test script to verify Uganda APIs are working with real data
 """
 import asyncio
+import io
 import sys
 import os
 
@@ -14,98 +15,107 @@ from services.soil_service import soil_service
 
 async def test_uganda_apis():
     """Test all Uganda-specific API integrations"""
-    print("=== Testing Uganda API Integrations ===\n")
+    # Collect the report in memory and write it to stdout in one go
+    buf = io.StringIO()
+    
+    def p(*args, **kwargs):
+        print(*args, **kwargs, file=buf)
+    
+    p("=== Testing Uganda API Integrations ===\n")
     
     # Test Uganda location service
-    print("1. Testing Uganda Location Service:")
+    p("1. Testing Uganda Location Service:")
     kampala = uganda_service.get_location("Kampala")
     if kampala:
-        print(f"   ✅ Kampala location: {kampala.latitude}, {kampala.longitude}")
-        print(f"   ✅ District: {kampala.district}, Region: {kampala.region.value}")
-        print(f"   ✅ Climate Zone: {kampala.climate_zone.value}")
-        print(f"   ✅ Main Crops: {kampala.main_crops[:3]}")
+        p(f"   ✅ Kampala location: {kampala.latitude}, {kampala.longitude}")
+        p(f"   ✅ District: {kampala.district}, Region: {kampala.region.label}")
+        p(f"   ✅ Climate Zone: {kampala.climate_zone.label}")
+        p(f"   ✅ Main Crops: {kampala.main_crops[:3]}")
     else:
-        print("   ❌ Failed to get Kampala location")
+        p("   ❌ Failed to get Kampala location")
     
-    print(f"   ✅ Total locations available: {len(uganda_service.get_all_locations())}")
+    p(f"   ✅ Total locations available: {len(uganda_service.get_all_locations())}")
     
     # Test climate service with Uganda data
-    print("\n2. Testing Climate Service with Uganda Data:")
+    p("\n2. Testing Climate Service with Uganda Data:")
     try:
         weather_data = await climate_service.get_weather_for_ugandan_location("Kampala")
         if weather_data:
-            print(f"   ✅ Current weather for Kampala:")
+            p(f"   ✅ Current weather for Kampala:")
             # Handle both dict and WeatherData object
             if hasattr(weather_data, 'temperature_avg'):
-                print(f"       Temperature: {weather_data.temperature_avg}°C")
-                print(f"       Humidity: {weather_data.humidity}%")
-                print(f"       Rainfall: {weather_data.rainfall}mm")
+                p(f"       Temperature: {weather_data.temperature_avg}°C")
+                p(f"       Humidity: {weather_data.humidity}%")
+                p(f"       Rainfall: {weather_data.rainfall}mm")
             elif isinstance(weather_data, dict):
-                print(f"       Temperature: {weather_data.get('temperature', 'N/A')}°C")
-                print(f"       Humidity: {weather_data.get('humidity', 'N/A')}%")
-                print(f"       Description: {weather_data.get('description', 'N/A')}")
+                p(f"       Temperature: {weather_data.get('temperature', 'N/A')}°C")
+                p(f"       Humidity: {weather_data.get('humidity', 'N/A')}%")
+                p(f"       Description: {weather_data.get('description', 'N/A')}")
             else:
-                print(f"       Weather data type: {type(weather_data)}")
+                p(f"       Weather data type: {type(weather_data)}")
         else:
-            print("   ⚠️  Weather data returned empty (check API key)")
+            p("   ⚠️  Weather data returned empty (check API key)")
     except Exception as e:
-        print(f"   ❌ Climate service error: {e}")
+        p(f"   ❌ Climate service error: {e}")
     
     # Test regional weather
     try:
         regional_weather = await climate_service.get_regional_weather_uganda("Central")
         if regional_weather:
-            print(f"   ✅ Regional weather for Central region: {len(regional_weather)} locations")
+            p(f"   ✅ Regional weather for Central region: {len(regional_weather)} locations")
         else:
-            print("   ⚠️  Regional weather returned empty")
+            p("   ⚠️  Regional weather returned empty")
     except Exception as e:
-        print(f"   ❌ Regional weather error: {e}")
+        p(f"   ❌ Regional weather error: {e}")
     
     # Test soil service with Uganda data
-    print("\n3. Testing Soil Service with Uganda Data:")
+    p("\n3. Testing Soil Service with Uganda Data:")
     try:
         soil_data = await soil_service.get_soil_for_ugandan_location("Kampala")
         if soil_data:
-            print(f"   ✅ Soil data for Kampala:")
+            p(f"   ✅ Soil data for Kampala:")
             # Handle both dict and SoilData object
             if hasattr(soil_data, 'ph_level'):
-                print(f"       pH: {soil_data.ph_level}")
-                print(f"       Organic Matter: {soil_data.organic_matter}%")
-                print(f"       Texture: {soil_data.texture}")
+                p(f"       pH: {soil_data.ph_level}")
+                p(f"       Organic Matter: {soil_data.organic_matter}%")
+                p(f"       Texture: {soil_data.texture}")
             elif isinstance(soil_data, dict):
-                print(f"       pH: {soil_data.get('ph', 'N/A')}")
-                print(f"       Organic Carbon: {soil_data.get('organic_carbon', 'N/A')}%")
-                print(f"       Sand Content: {soil_data.get('sand_content', 'N/A')}%")
+                p(f"       pH: {soil_data.get('ph', 'N/A')}")
+                p(f"       Organic Carbon: {soil_data.get('organic_carbon', 'N/A')}%")
+                p(f"       Sand Content: {soil_data.get('sand_content', 'N/A')}%")
             else:
-                print(f"       Soil data type: {type(soil_data)}")
+                p(f"       Soil data type: {type(soil_data)}")
         else:
-            print("   ⚠️  Soil data returned empty")
+            p("   ⚠️  Soil data returned empty")
     except Exception as e:
-        print(f"   ❌ Soil service error: {e}")
+        p(f"   ❌ Soil service error: {e}")
     
     # Test soil health assessment
     try:
         soil_health = await soil_service.assess_soil_health_uganda("Kampala")
         if soil_health:
-            print(f"   ✅ Soil health assessment:")
+            p(f"   ✅ Soil health assessment:")
             if isinstance(soil_health, dict):
-                print(f"       Overall Health: {soil_health.get('health_score', 'N/A')}")
+                p(f"       Overall Health: {soil_health.get('health_score', 'N/A')}")
                 recommendations = soil_health.get('improvement_recommendations', [])
-                print(f"       Recommendations: {len(recommendations)} items")
+                p(f"       Recommendations: {len(recommendations)} items")
                 if recommendations:
-                    print(f"       Top recommendation: {recommendations[0].get('action', 'N/A')}")
+                    p(f"       Top recommendation: {recommendations[0].get('action', 'N/A')}")
             else:
-                print(f"       Health data type: {type(soil_health)}")
+                p(f"       Health data type: {type(soil_health)}")
         else:
-            print("   ⚠️  Soil health assessment returned empty")
+            p("   ⚠️  Soil health assessment returned empty")
     except Exception as e:
-        print(f"   ❌ Soil health assessment error: {e}")
+        p(f"   ❌ Soil health assessment error: {e}")
+    
+    p("\n=== Test Completed ===")
+    p("✅ Uganda data integration is ready!")
+    p("✅ Real seed varieties and farms populated in database")
+    p("✅ API services configured for Uganda locations")
+    p("\nYour Climate-Adaptive Seed AI Bank now uses real data for Uganda! 🇺🇬")
     
-    print("\n=== Test Completed ===")
-    print("✅ Uganda data integration is ready!")
-    print("✅ Real seed varieties and farms populated in database")
-    print("✅ API services configured for Uganda locations")
-    print("\nYour Climate-Adaptive Seed AI Bank now uses real data for Uganda! 🇺🇬")
+    sys.stdout.write(buf.getvalue())
+    sys.stdout.flush()
 
 if __name__ == "__main__":
     asyncio.run(test_uganda_apis())
\ No newline at end of file
@@ -0,0 +1,131 @@
+"""
+Tests for the Uganda location query APIs
+"""
+import math
+import random
+
+import pytest
+
+import services.uganda_service as uganda_module
+from services.uganda_service import UgandaLocationService, uganda_service
+
+def _brute_force_bbox(lat_lo, lat_hi, lon_lo, lon_hi):
+    return {
+        loc.name for loc in uganda_service.get_all_locations()
+        if lat_lo <= loc.latitude <= lat_hi and lon_lo <= loc.longitude <= lon_hi
+    }
+
+def _haversine_km(lat1, lon1, lat2, lon2):
+    a = (math.sin(math.radians(lat2 - lat1) / 2) ** 2 +
+         math.cos(math.radians(lat1)) * math.cos(math.radians(lat2)) * math.sin(math.radians(lon2 - lon1) / 2) ** 2)
+    return 2 * uganda_module.EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+def _random_points(n=500, seed=7):
+    rng = random.Random(seed)
+    return [(rng.uniform(-2.0, 5.0), rng.uniform(29.0, 36.0)) for _ in range(n)]
+
+# prefix_search
+
+def test_empty_prefix_returns_every_location_alphabetically():
+    names = [loc.name for loc in uganda_service.prefix_search("")]
+    assert names == sorted((loc.name for loc in uganda_service.get_all_locations()), key=str.casefold)
+
+def test_prefix_is_case_insensitive():
+    assert [loc.name for loc in uganda_service.prefix_search("KAM")] == ["Kampala"]
+    assert uganda_service.prefix_search("kam") == uganda_service.prefix_search("Kam")
+
+def test_prefix_past_the_last_name_is_empty():
+    last = max(loc.name.casefold() for loc in uganda_service.get_all_locations())
+    assert uganda_service.prefix_search(last + "z") == ()
+    assert uganda_service.prefix_search("zzz") == ()
+    assert uganda_service.prefix_search("\U0010ffff") == ()
+
+def test_full_name_matches_itself():
+    for loc in uganda_service.get_all_locations():
+        assert loc in uganda_service.prefix_search(loc.name)
+
+# locations_within_bbox / locations_within_radius_km
+
+def test_bbox_edges_are_inclusive():
+    kampala = uganda_service.get_location("Kampala")
+    found = uganda_service.locations_within_bbox(kampala.latitude, kampala.latitude,
+                                                 kampala.longitude, kampala.longitude)
+    assert found == (kampala,)
+    
+    # Nudging any edge past the coordinate excludes it
+    eps = 1e-9
+    assert kampala not in uganda_service.locations_within_bbox(kampala.latitude + eps, 10, 20, 40)
+    assert kampala not in uganda_service.locations_within_bbox(-10, kampala.latitude - eps, 20, 40)
+    assert kampala not in uganda_service.locations_within_bbox(-10, 10, kampala.longitude + eps, 40)
+    assert kampala not in uganda_service.locations_within_bbox(-10, 10, 20, kampala.longitude - eps)
+
+@pytest.mark.parametrize("bbox", [
+    (-1.0, 1.0, 29.0, 36.0),    # straddles the equator
+    (-0.5, 0.5, 32.0, 33.0),
+    (2.0, 4.0, 31.0, 35.0),
+    (-90.0, 90.0, -180.0, 180.0),
+    (10.0, 20.0, 29.0, 36.0),   # north of every location
+    (1.0, -1.0, 29.0, 36.0),    # inverted
+])
+def test_bbox_matches_brute_force(bbox):
+    assert {loc.name for loc in uganda_service.locations_within_bbox(*bbox)} == _brute_force_bbox(*bbox)
+
+@pytest.mark.parametrize("latitude, longitude, radius_km", [
+    (0.3476, 32.5825, 0.0),
+    (0.3476, 32.5825, 50.0),
+    (0.0, 32.0, 150.0),
+    (2.0, 33.0, 400.0),
+    (1.0, 32.0, 20000.0),       # cap covers the whole sphere
+    (89.9, 0.0, 10500.0),       # cap around the pole spans every longitude
+])
+def test_radius_matches_brute_force(latitude, longitude, radius_km):
+    expected = {
+        loc.name for loc in uganda_service.get_all_locations()
+        if _haversine_km(latitude, longitude, loc.latitude, loc.longitude) <= radius_km
+    }
+    found = uganda_service.locations_within_radius_km(latitude, longitude, radius_km)
+    assert {loc.name for loc in found} == expected
+
+# find_nearest_location(s)
+
+def _pure_python_service(monkeypatch):
+    """Service built and queried without numpy, numba or scipy"""
+    monkeypatch.setattr(uganda_module, "HAS_NUMPY", False)
+    monkeypatch.setattr(uganda_module, "HAS_NUMBA", False)
+    monkeypatch.setattr(uganda_module, "HAS_KDTREE", False)
+    return UgandaLocationService()
+
+def test_nearest_location_backends_agree(monkeypatch):
+    pytest.importorskip("numpy")
+    points = _random_points()
+    lats = [lat for lat, _ in points]
+    lons = [lon for _, lon in points]
+    
+    # Whatever the default backend is (KD-tree when scipy is installed)
+    default_single = [uganda_service.find_nearest_location(lat, lon) for lat, lon in points]
+    default_batch = uganda_service.find_nearest_locations(lats, lons)
+    
+    # numpy broadcast path
+    broadcast = UgandaLocationService()
+    broadcast._tree = None
+    monkeypatch.setattr(uganda_module, "HAS_NUMBA", False)
+    broadcast_batch = broadcast.find_nearest_locations(lats, lons)
+    
+    # numba kernel (or its plain-Python fallback)
+    kernel = [
+        broadcast._loc_list[uganda_module._nearest_idx(broadcast._lat, broadcast._lon, lat, lon)]
+        for lat, lon in points
+    ]
+    
+    pure = _pure_python_service(monkeypatch)
+    pure_single = [pure.find_nearest_location(lat, lon) for lat, lon in points]
+    
+    names = lambda locations: [loc.name for loc in locations]
+    assert names(default_single) == names(pure_single)
+    assert names(default_batch) == names(pure_single)
+    assert names(broadcast_batch) == names(pure_single)
+    assert names(kernel) == names(pure_single)
+
+def test_nearest_location_of_a_location_is_itself():
+    for loc in uganda_service.get_all_locations():
+        assert uganda_service.find_nearest_location(loc.latitude, loc.longitude) is loc